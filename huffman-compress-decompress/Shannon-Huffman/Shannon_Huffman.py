@@ -1,6 +1,6 @@
 """
-Simple Shannon-Fano and Huffman Compression
-Demonstrates that both algorithms produce equivalent decompressed output.
+Simple Shannon-Fano, Huffman, Arithmetic and rANS Compression
+Demonstrates that all algorithms produce equivalent decompressed output.
 """
 
 import heapq
@@ -263,6 +263,187 @@ def arithmetic_decompress(compressed_data, metadata, padding=0):
     return ''.join(result)
 
 
+# ============================================================================
+# INTERLEAVED rANS ALGORITHM
+# ============================================================================
+
+RANS_PROB_BITS = 14            # Quantized frequencies sum to at most 2^14
+RANS_MAX_PROB_BITS = 16        # Upper limit for very large alphabets
+RANS_LOWER_BOUND = 1 << 16     # States stay in [2^16, 2^24), 3-byte flush
+RANS_STATE_BYTES = 3           # Bytes needed to flush one state
+RANS_NUM_STATES = 4            # Maximum number of interleaved states (lanes)
+RANS_LANE_SYMBOLS = 4096       # Minimum symbols per lane
+
+
+def rans_prob_bits(text_length, unique_count):
+    """Choose frequency precision: less for short texts, enough for alphabet."""
+    prob_bits = min(RANS_PROB_BITS, text_length.bit_length() + 2)
+    while (1 << prob_bits) < unique_count:
+        prob_bits += 1
+    if prob_bits > RANS_MAX_PROB_BITS:
+        raise ValueError(f"Too many unique characters for rANS: {unique_count}")
+    return prob_bits
+
+
+def rans_num_states(text_length):
+    """Choose lane count: one lane for short texts, up to RANS_NUM_STATES."""
+    return max(1, min(RANS_NUM_STATES, text_length // RANS_LANE_SYMBOLS))
+
+
+def quantize_frequencies(frequencies, prob_bits):
+    """Scale frequencies so they sum to 2^prob_bits, keeping each >= 1."""
+    total_target = 1 << prob_bits
+    total = sum(frequencies.values())
+
+    quantized = {}
+    for char, freq in frequencies.items():
+        quantized[char] = max(1, freq * total_target // total)
+
+    # Fix rounding error on the most frequent symbols
+    by_freq = sorted(quantized, key=lambda c: frequencies[c], reverse=True)
+    diff = total_target - sum(quantized.values())
+    if diff > 0:
+        quantized[by_freq[0]] += diff
+    while diff < 0:
+        for char in by_freq:
+            if quantized[char] > 1:
+                quantized[char] -= 1
+                diff += 1
+                if diff == 0:
+                    break
+
+    return quantized
+
+
+def build_rans_cumulative(quantized):
+    """Build cumulative frequency table (start slot of each symbol)."""
+    cumulative = {}
+    start = 0
+    for char in sorted(quantized):
+        cumulative[char] = start
+        start += quantized[char]
+    return cumulative
+
+
+def build_rans_table(quantized):
+    """Build slot -> (symbol, freq, start slot) decode table."""
+    slot_table = []
+    for char in sorted(quantized):
+        freq = quantized[char]
+        slot_table.extend([(char, freq, len(slot_table))] * freq)
+    return slot_table
+
+
+def rans_compress(text, num_states=None):
+    """
+    Compress text using static interleaved rANS.
+
+    Symbol i is coded by lane i % num_states. Each lane has its own state
+    and its own byte stream, so lanes never depend on each other. The lane
+    streams are stored one after another; their sizes go in the metadata.
+    """
+    if not text:
+        return b'', {}
+
+    if num_states is None:
+        num_states = rans_num_states(len(text))
+
+    frequencies = analyze_frequencies(text)
+    prob_bits = rans_prob_bits(len(text), len(frequencies))
+    quantized = quantize_frequencies(frequencies, prob_bits)
+    cumulative = build_rans_cumulative(quantized)
+
+    # Per-symbol (freq, start slot, renormalization limit)
+    x_max_base = (RANS_LOWER_BOUND >> prob_bits) << 8
+    encode_table = {
+        char: (freq, cumulative[char], x_max_base * freq)
+        for char, freq in quantized.items()
+    }
+    streams = []
+
+    for lane in range(num_states):
+        x = RANS_LOWER_BOUND
+        out = bytearray()
+
+        # Encode backwards so the decoder can run forwards
+        for char in reversed(text[lane::num_states]):
+            freq, start_slot, x_max = encode_table[char]
+
+            # Renormalize: push low bytes until x fits
+            while x >= x_max:
+                out.append(x & 0xFF)
+                x >>= 8
+
+            q, r = divmod(x, freq)
+            x = (q << prob_bits) + r + start_slot
+
+        # Flush final state, low byte first (read back high byte first)
+        for _ in range(RANS_STATE_BYTES):
+            out.append(x & 0xFF)
+            x >>= 8
+
+        out.reverse()
+        streams.append(bytes(out))
+
+    metadata = {
+        'frequencies': frequencies,
+        'quantized': quantized,
+        'prob_bits': prob_bits,
+        'num_states': num_states,
+        'lane_sizes': [len(stream) for stream in streams],
+        'text_length': len(text)
+    }
+
+    return b''.join(streams), metadata
+
+
+def rans_decompress(compressed_data, metadata):
+    """
+    Decompress data using static interleaved rANS.
+
+    Every lane has its own state and its own byte stream, so lanes never
+    depend on each other: one round (one symbol per lane) is a pure batch
+    step that a SIMD decoder runs as a single vector operation. Each step
+    is one table lookup (slot -> symbol, freq, start), with no tree walk.
+    Here each lane runs in its own tight loop, and slice assignment puts
+    the lane outputs back in text order.
+    """
+    if not compressed_data or not metadata:
+        return ""
+
+    prob_bits = metadata['prob_bits']
+    num_states = metadata['num_states']
+    text_length = metadata['text_length']
+    slot_table = build_rans_table(metadata['quantized'])
+
+    mask = (1 << prob_bits) - 1
+    result = [None] * text_length
+    start = 0
+
+    for lane, size in enumerate(metadata['lane_sizes']):
+        # Lane stream starts with that lane's final encoder state
+        pos = start + RANS_STATE_BYTES
+        x = int.from_bytes(compressed_data[start:pos], 'big')
+        start += size
+
+        symbols = []
+        for _ in range(lane, text_length, num_states):
+            slot = x & mask
+            char, freq, start_slot = slot_table[slot]
+            symbols.append(char)
+            x = freq * (x >> prob_bits) + slot - start_slot
+
+            # Renormalize: pull bytes from this lane's stream
+            while x < RANS_LOWER_BOUND:
+                x = (x << 8) | compressed_data[pos]
+                pos += 1
+
+        # Lane k holds text[k::num_states]
+        result[lane::num_states] = symbols
+
+    return ''.join(result)
+
+
 # ============================================================================
 # DEMONSTRATION
 # ============================================================================
@@ -283,9 +464,9 @@ def print_stats(name, original_text, compressed_data, code_table):
 
 
 def demo_equivalence(text):
-    """Demonstrate that all three algorithms produce equivalent output."""
+    """Demonstrate that all four algorithms produce equivalent output."""
     print("=" * 70)
-    print("SHANNON-FANO vs HUFFMAN vs ARITHMETIC CODING COMPARISON")
+    print("SHANNON-FANO vs HUFFMAN vs ARITHMETIC CODING vs rANS COMPARISON")
     print("=" * 70)
     print(f"\nOriginal Text ({len(text)} chars):")
     print(f'"{text[:100]}{"..." if len(text) > 100 else ""}"')
@@ -311,27 +492,37 @@ def demo_equivalence(text):
     arithmetic_compressed, arithmetic_metadata, _ = arithmetic_compress(text)
     print_stats("Arithmetic", text, arithmetic_compressed, arithmetic_metadata['frequencies'])
 
-    # Decompress all three
+    # Compress with interleaved rANS
+    print("\n" + "-" * 70)
+    print("4. INTERLEAVED rANS COMPRESSION")
+    print("-" * 70)
+    rans_compressed, rans_metadata = rans_compress(text)
+    print_stats("rANS", text, rans_compressed, rans_metadata['frequencies'])
+
+    # Decompress all four
     print("\n" + "-" * 70)
-    print("4. DECOMPRESSION TEST")
+    print("5. DECOMPRESSION TEST")
     print("-" * 70)
 
     shannon_decompressed = shannon_fano_decompress(shannon_compressed, shannon_tree, shannon_padding)
     huffman_decompressed = huffman_decompress(huffman_compressed, huffman_tree, huffman_padding)
     arithmetic_decompressed = arithmetic_decompress(arithmetic_compressed, arithmetic_metadata)
+    rans_decompressed = rans_decompress(rans_compressed, rans_metadata)
 
     shannon_match = (shannon_decompressed == text)
     huffman_match = (huffman_decompressed == text)
     arithmetic_match = (arithmetic_decompressed == text)
+    rans_match = (rans_decompressed == text)
 
     print(f"Shannon-Fano decompression:  {'PASS' if shannon_match else 'FAIL'}")
     print(f"Huffman decompression:       {'PASS' if huffman_match else 'FAIL'}")
     print(f"Arithmetic decompression:    {'PASS' if arithmetic_match else 'FAIL'}")
+    print(f"rANS decompression:          {'PASS' if rans_match else 'FAIL'}")
 
     # Equivalence check
     print("\n" + "=" * 70)
-    if shannon_match and huffman_match and arithmetic_match:
-        print("SUCCESS: All three algorithms produce identical output!")
+    if shannon_match and huffman_match and arithmetic_match and rans_match:
+        print("SUCCESS: All four algorithms produce identical output!")
         print("=" * 70)
         return True
     else:
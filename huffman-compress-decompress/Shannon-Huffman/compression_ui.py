@@ -1,33 +1,34 @@
 """
-Simple UI for Shannon-Fano, Huffman, and Arithmetic Coding Compression
+Simple UI for Shannon-Fano, Huffman, Arithmetic Coding and rANS Compression
 Shows compression statistics, code tables, and comparison
 """
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, filedialog, messagebox
 from Shannon_Huffman import (
-    shannon_fano_compress, huffman_compress, arithmetic_compress,
-    shannon_fano_decompress, huffman_decompress, arithmetic_decompress
+    shannon_fano_compress, huffman_compress, arithmetic_compress, rans_compress,
+    shannon_fano_decompress, huffman_decompress, arithmetic_decompress, rans_decompress
 )
 
 
 class CompressionUI:
     def __init__(self, root):
         self.root = root
-        self.root.title("Shannon-Fano vs Huffman vs Arithmetic Coding")
-        self.root.geometry("1400x850")
+        self.root.title("Shannon-Fano vs Huffman vs Arithmetic Coding vs rANS")
+        self.root.geometry("1600x850")
 
         # Variables
         self.original_text = ""
         self.shannon_data = None
         self.huffman_data = None
         self.arithmetic_data = None
+        self.rans_data = None
 
         self.create_widgets()
 
     def create_widgets(self):
         # Title
-        title = tk.Label(self.root, text="Shannon-Fano vs Huffman vs Arithmetic Coding",
+        title = tk.Label(self.root, text="Shannon-Fano vs Huffman vs Arithmetic Coding vs rANS",
                         font=("Arial", 16, "bold"), pady=10)
         title.pack()
 
@@ -54,11 +55,11 @@ class CompressionUI:
         # Compress button
         compress_frame = tk.Frame(self.root)
         compress_frame.pack(pady=10)
-        ttk.Button(compress_frame, text="COMPRESS WITH ALL THREE ALGORITHMS",
+        ttk.Button(compress_frame, text="COMPRESS WITH ALL FOUR ALGORITHMS",
                   command=self.compress_all,
                   style="Big.TButton").pack()
 
-        # Results section (3 columns)
+        # Results section (4 columns)
         results_frame = tk.Frame(self.root)
         results_frame.pack(fill="both", expand=True, padx=10, pady=5)
 
@@ -92,10 +93,10 @@ class CompressionUI:
                                                        font=("Consolas", 7))
         self.huffman_codes.pack(fill="both", expand=True)
 
-        # Arithmetic results (right)
+        # Arithmetic results (middle)
         arithmetic_frame = ttk.LabelFrame(results_frame, text="Arithmetic Coding Results",
                                          padding=8)
-        arithmetic_frame.pack(side="left", fill="both", expand=True, padx=(3, 0))
+        arithmetic_frame.pack(side="left", fill="both", expand=True, padx=3)
 
         self.arithmetic_stats = tk.Text(arithmetic_frame, height=6, width=30,
                                        font=("Consolas", 8), state="disabled")
@@ -107,12 +108,27 @@ class CompressionUI:
                                                          font=("Consolas", 7))
         self.arithmetic_codes.pack(fill="both", expand=True)
 
+        # rANS results (right)
+        rans_frame = ttk.LabelFrame(results_frame, text="Interleaved rANS Results",
+                                    padding=8)
+        rans_frame.pack(side="left", fill="both", expand=True, padx=(3, 0))
+
+        self.rans_stats = tk.Text(rans_frame, height=6, width=30,
+                                  font=("Consolas", 8), state="disabled")
+        self.rans_stats.pack(fill="x", pady=(0, 3))
+
+        tk.Label(rans_frame, text="Quantized Frequency Table:",
+                font=("Arial", 8, "bold")).pack(anchor="w")
+        self.rans_codes = scrolledtext.ScrolledText(rans_frame, height=12,
+                                                    font=("Consolas", 7))
+        self.rans_codes.pack(fill="both", expand=True)
+
         # Comparison section
         comparison_frame = ttk.LabelFrame(self.root, text="Equivalence Test",
                                          padding=10)
         comparison_frame.pack(fill="x", padx=10, pady=5)
 
-        self.comparison_text = tk.Text(comparison_frame, height=4,
+        self.comparison_text = tk.Text(comparison_frame, height=5,
                                       font=("Consolas", 9), state="disabled")
         self.comparison_text.pack(fill="x")
 
@@ -146,7 +162,7 @@ class CompressionUI:
         self.input_text.delete(1.0, tk.END)
 
     def compress_all(self):
-        """Compress with all three algorithms and show results"""
+        """Compress with all four algorithms and show results"""
         # Get input text
         text = self.input_text.get(1.0, tk.END).strip()
         if not text:
@@ -168,10 +184,14 @@ class CompressionUI:
             arithmetic_compressed, arithmetic_metadata, arithmetic_padding = \
                 arithmetic_compress(text)
 
+            # Compress with interleaved rANS
+            rans_compressed, rans_metadata = rans_compress(text)
+
             # Store data
             self.shannon_data = (shannon_compressed, shannon_tree, shannon_padding)
             self.huffman_data = (huffman_compressed, huffman_tree, huffman_padding)
             self.arithmetic_data = (arithmetic_compressed, arithmetic_metadata, arithmetic_padding)
+            self.rans_data = (rans_compressed, rans_metadata)
 
             # Display results
             self.display_stats(self.shannon_stats, "Shannon-Fano", text,
@@ -186,6 +206,10 @@ class CompressionUI:
                              arithmetic_compressed, arithmetic_metadata['frequencies'])
             self.display_codes(self.arithmetic_codes, arithmetic_metadata['frequencies'], is_freq=True)
 
+            self.display_stats(self.rans_stats, "rANS", text,
+                             rans_compressed, rans_metadata['frequencies'])
+            self.display_codes(self.rans_codes, rans_metadata['quantized'], is_freq=True)
+
             # Test decompression
             shannon_decompressed = shannon_fano_decompress(
                 shannon_compressed, shannon_tree, shannon_padding)
@@ -193,10 +217,11 @@ class CompressionUI:
                 huffman_compressed, huffman_tree, huffman_padding)
             arithmetic_decompressed = arithmetic_decompress(
                 arithmetic_compressed, arithmetic_metadata, arithmetic_padding)
+            rans_decompressed = rans_decompress(rans_compressed, rans_metadata)
 
             # Display comparison
             self.display_comparison(text, shannon_decompressed, huffman_decompressed,
-                                  arithmetic_decompressed)
+                                  arithmetic_decompressed, rans_decompressed)
 
         except Exception as e:
             messagebox.showerror("Error", f"Compression failed: {e}")
@@ -258,12 +283,13 @@ Symbols:      {len(codes):>6}
         if len(codes) > 30:
             widget.insert(tk.END, f"\n... ({len(codes) - 30} more)")
 
-    def display_comparison(self, original, shannon_dec, huffman_dec, arithmetic_dec):
+    def display_comparison(self, original, shannon_dec, huffman_dec, arithmetic_dec, rans_dec):
         """Display decompression comparison"""
         shannon_match = (shannon_dec == original)
         huffman_match = (huffman_dec == original)
         arithmetic_match = (arithmetic_dec == original)
-        all_match = shannon_match and huffman_match and arithmetic_match
+        rans_match = (rans_dec == original)
+        all_match = shannon_match and huffman_match and arithmetic_match and rans_match
 
         if all_match:
             result = """SUCCESS: EQUIVALENCE VERIFIED!
@@ -271,8 +297,9 @@ Symbols:      {len(codes):>6}
 Shannon-Fano decompression:   PASS
 Huffman decompression:        PASS
 Arithmetic decompression:     PASS
+rANS decompression:           PASS
 
-All three algorithms produce IDENTICAL output!"""
+All four algorithms produce IDENTICAL output!"""
             bg_color = "#d4edda"
             fg_color = "#155724"
         else:
@@ -280,7 +307,8 @@ All three algorithms produce IDENTICAL output!"""
 """ + "=" * 60 + """
 Shannon-Fano:  """ + ("PASS" if shannon_match else "FAIL") + """
 Huffman:       """ + ("PASS" if huffman_match else "FAIL") + """
-Arithmetic:    """ + ("PASS" if arithmetic_match else "FAIL")
+Arithmetic:    """ + ("PASS" if arithmetic_match else "FAIL") + """
+rANS:          """ + ("PASS" if rans_match else "FAIL")
             bg_color = "#f8d7da"
             fg_color = "#721c24"
 